@@ -1,3 +1,3 @@
 from .fields import *
 
-__version__ = '1.0.4'
+__version__ = '1.0.5'
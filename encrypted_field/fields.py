@@ -14,19 +14,40 @@ It is easy to use:
 Now, whenever you save or retrieve values they will be managed through an
 encryption-decryption process transparent to the user.
 """
+import os
+import struct
 import typing
-import json
 import logging
-
-from base64 import b64encode, b64decode
+import functools
+import itertools
+
+# pybase64 is a SIMD (AVX2) base64 codec, 4-10x faster than the stdlib
+# scalar one. It is optional: fall back to the stdlib if not installed.
+try:
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
+# orjson is a much faster JSON parser, only relevant for rows still in
+# the legacy JSON envelope. Optional as well.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import (
+    ChaCha20Poly1305, AESGCM
+)
 from Cryptodome.Cipher import (
-    ChaCha20_Poly1305, ChaCha20, Salsa20,
+    ChaCha20, Salsa20,
     AES
 )
 from Cryptodome.Random import get_random_bytes
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.db import models
 
 
@@ -34,13 +55,39 @@ from django.db import models
 logger = logging.getLogger(__name__)
 
 
+# settings.DEBUG goes through LazySettings.__getattr__ on every access,
+# which is measurable in a tight save/load loop. Resolve the flags once at
+# import and keep them in sync through the setting_changed signal. When
+# settings are not configured yet (plain interpreter import) default to
+# False instead of raising ImproperlyConfigured.
+_DEBUG = False
+_UNIT_TESTING = False
+
+if settings.configured:
+    _DEBUG = bool(settings.DEBUG)
+    _UNIT_TESTING = bool(getattr(settings, 'UNIT_TESTING', False))
+
+
+def _refresh_flags(**kwargs):
+    global _DEBUG, _UNIT_TESTING
+    _DEBUG = bool(getattr(settings, 'DEBUG', False))
+    _UNIT_TESTING = bool(getattr(settings, 'UNIT_TESTING', False))
+    # Cached plaintext is keyed on the key too, but a settings change is
+    # the natural invalidation point (e.g. key rotation in tests).
+    _decrypt_cached.cache_clear()
+
+
+setting_changed.connect(_refresh_flags)
+
+
 __all__ = [
     'EncryptedField',
     'MissingKeyException',
     'InvalidKeyFormatException',
     'InvalidKeyLengthException',
     'UnknownAlgorithmException',
-    'AESInvalidAlgorithmException'
+    'AESInvalidAlgorithmException',
+    'InvalidEncryptedDataException'
 ]
 
 
@@ -61,7 +108,8 @@ AES_KEY_SIZES = (
     ('A256', '256 bits / 32 bytes long'),
 )
 
-AES_VALID_KEY_SIZES_IN_LEN = [16, 24, 32]
+# frozenset so membership checks are O(1) instead of a linear scan.
+AES_VALID_KEY_SIZES_IN_LEN = frozenset({16, 24, 32})
 
 
 ENCRYPTION_ALGORITHM = (
@@ -76,16 +124,34 @@ ENCRYPTION_ALGORITHM = (
 )
 
 
-ALGORITHM_AES_ALGORITHMS = [
+# Plain stream ciphers: no integrity tag and no authenticated header.
+ALGORITHM_STREAM_ALGORITHMS = frozenset({
+    ALGORITHM_CHACHA20,
+    ALGORITHM_SALSA20,
+})
+
+
+ALGORITHM_AES_ALGORITHMS = frozenset({
     ALGORITHM_AES_GCM,
     ALGORITHM_AES_SIV,
     ALGORITHM_AES_EAX,
     ALGORITHM_AES_CCM,
-    ALGORITHM_AES_OCB
-]
+    ALGORITHM_AES_OCB,
+})
+
 
+# O(1) algorithm -> AES mode lookup, instead of an if/elif ladder paying
+# up to five string comparisons per call.
+_AES_MODES = {
+    ALGORITHM_AES_GCM: AES.MODE_GCM,
+    ALGORITHM_AES_SIV: AES.MODE_SIV,
+    ALGORITHM_AES_EAX: AES.MODE_EAX,
+    ALGORITHM_AES_CCM: AES.MODE_CCM,
+    ALGORITHM_AES_OCB: AES.MODE_OCB,
+}
 
-ALLOWED_ENCRYPTION_ALGORITHMS = [
+
+ALLOWED_ENCRYPTION_ALGORITHMS = frozenset({
     ALGORITHM_CHACHA20_POLY1305,
     ALGORITHM_CHACHA20,
     ALGORITHM_SALSA20,
@@ -94,7 +160,7 @@ ALLOWED_ENCRYPTION_ALGORITHMS = [
     ALGORITHM_AES_EAX,
     ALGORITHM_AES_CCM,
     ALGORITHM_AES_OCB,
-]
+})
 
 
 # Added specific exception classes to be able to differentiate from
@@ -119,18 +185,225 @@ class AESInvalidAlgorithmException(Exception):
     pass
 
 
-##############################################################################
-# Encryption primitives. Parameters are typed (type hintin) and all the
-# required details to be able to decreyt must be in the dictionary:
-#     encrypted_data
+class InvalidEncryptedDataException(Exception):
+    pass
+
+
+# Packed binary envelope written since 1.0.5. One b64encode over the whole
+# blob instead of a JSON object with four separately b64-encoded fields:
+#
+#     magic(1) | algo_id(1) | nonce_len(1) | tag_len(1) | nonce | tag | ct
 #
-# For example:
-#     encrypted_data['nonce']
-#     encrypted_data['header']
-#     encrypted_data['tag']
-#     ...
+# The header is not stored: it is rederived from the field. algo_id 0 means
+# the algorithm is hidden and must come from settings (hide_algorithm=True).
+_ENVELOPE_MAGIC = 0x01
+_ALGORITHM_HIDDEN_ID = 0
+
+_ALGORITHM_IDS = {
+    ALGORITHM_CHACHA20_POLY1305: 1,
+    ALGORITHM_CHACHA20: 2,
+    ALGORITHM_SALSA20: 3,
+    ALGORITHM_AES_GCM: 4,
+    ALGORITHM_AES_SIV: 5,
+    ALGORITHM_AES_EAX: 6,
+    ALGORITHM_AES_CCM: 7,
+    ALGORITHM_AES_OCB: 8,
+}
+
+_ALGORITHMS_BY_ID = {
+    algo_id: algorithm for algorithm, algo_id in _ALGORITHM_IDS.items()
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _envelope_prefix(algo_id: int, nonce_len: int, tag_len: int) -> bytes:
+    """
+    The 4-byte envelope prefix is one of a handful of combinations per
+    process (an algorithm has fixed nonce/tag lengths), so cache it and
+    skip the struct.pack call on every row.
+
+    :param algo_id: the envelope algorithm id.
+    :param nonce_len: the nonce length in bytes.
+    :param tag_len: the tag length in bytes.
+    :return: the packed 4-byte prefix.
+    """
+    return struct.pack('<BBBB', _ENVELOPE_MAGIC, algo_id, nonce_len, tag_len)
+
+
+def _pack(algorithm: str, nonce: bytes, tag: bytes, ciphertext: bytes,
+          hide_algorithm: bool = False) -> str:
+    """
+    Pack nonce, tag and ciphertext into the binary envelope and b64 it.
+
+    :param algorithm: the algorithm identifier (ALGORITHM_*).
+    :param nonce: the nonce. Bytes.
+    :param tag: the integrity tag, or b'' for the plain stream ciphers.
+    :param ciphertext: the encrypted data. Bytes.
+    :param hide_algorithm: set to True if we want to remove details about
+    the algorithm in the database.
+    :return: the whole envelope b64-encoded as string.
+    """
+    algo_id = _ALGORITHM_HIDDEN_ID if hide_algorithm else _ALGORITHM_IDS[algorithm]
+    nonce_len = len(nonce)
+    tag_len = len(tag)
+    # Write the envelope into one preallocated buffer instead of chaining
+    # bytes concatenations, so no intermediate copies are kept alive. For
+    # large values this halves the peak memory of the packing step.
+    blob = bytearray(4 + nonce_len + tag_len + len(ciphertext))
+    blob[0:4] = _envelope_prefix(algo_id, nonce_len, tag_len)
+    nonce_end = 4 + nonce_len
+    tag_end = nonce_end + tag_len
+    blob[4:nonce_end] = nonce
+    blob[nonce_end:tag_end] = tag
+    blob[tag_end:] = ciphertext
+    return b64encode(blob).decode('ascii')
+
+
+def _unpack(blob: bytes) -> typing.Tuple[typing.Optional[str], bytes, bytes, bytes]:
+    """
+    Split a binary envelope back into its parts. No JSON parser and no
+    per-field b64 involved, just struct.unpack plus slicing.
+
+    :param blob: the b64-decoded envelope. Bytes.
+    :return: a tuple (algorithm or None if hidden, nonce, tag, ciphertext).
+    """
+    if len(blob) < 4:
+        raise InvalidEncryptedDataException(
+            '_unpack: envelope too short [%d bytes].' % len(blob)
+        )
+
+    magic, algo_id, nonce_len, tag_len = struct.unpack_from('<BBBB', blob)
+    if magic != _ENVELOPE_MAGIC:
+        raise UnknownAlgorithmException(
+            '_unpack: unknown envelope magic [%d].' % magic
+        )
+
+    if algo_id == _ALGORITHM_HIDDEN_ID:
+        algorithm = None
+    else:
+        algorithm = _ALGORITHMS_BY_ID.get(algo_id)
+        if algorithm is None:
+            raise UnknownAlgorithmException(
+                '_unpack: unknown algorithm id [%d].' % algo_id
+            )
+
+    nonce_end = 4 + nonce_len
+    tag_end = nonce_end + tag_len
+    if len(blob) < tag_end:
+        raise InvalidEncryptedDataException(
+            '_unpack: truncated envelope [%d bytes, expected at least %d].'
+            % (len(blob), tag_end)
+        )
+
+    return (algorithm,
+            blob[4:nonce_end],
+            blob[nonce_end:tag_end],
+            blob[tag_end:])
+
+
+def _to_bytes(data) -> bytes:
+    """
+    Plaintext normalization for the encrypt primitives. Callers that
+    already hold bytes skip the utf-8 round trip entirely.
+
+    :param data: the plaintext as string or bytes.
+    :return: the plaintext as bytes.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    return data.encode('utf-8')
+
+
+def validate_key(key: bytes,
+                 valid_lengths: tuple = (32,),
+                 where: str = 'validate_key') -> None:
+    """
+    Validate that a key is bytes and has one of the allowed lengths.
+
+    EncryptedField runs this once per encrypt/decrypt call (in _get_key)
+    for every algorithm; the primitives only re-run it under __debug__
+    for direct callers, so python -O strips the redundant checks from
+    the hot path.
+
+    :param key: the key to validate.
+    :param valid_lengths: the key lengths the algorithm accepts.
+    :param where: the caller name, used to prefix error messages.
+    :return: nothing. Raises InvalidKeyLengthException when invalid.
+    """
+    # key must be BYTES. type() is a C-level pointer compare for the
+    # common case; the tuple isinstance only runs for subclasses and
+    # bytearray.
+    if type(key) is not bytes and not isinstance(key, (bytes, bytearray)):
+        message = '%s: key must be BYTES.' % where
+        if _DEBUG:
+            logger.error(message)
+        raise InvalidKeyLengthException(message)
+
+    key_len = len(key)
+    if key_len not in valid_lengths:
+        if valid_lengths == (32,):
+            message = '%s: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % (where, key_len)
+        else:
+            message = '%s: key must be 16, 24 or 32 bytes bit long. You passed [%d] bytes.' % (where, key_len)
+        if _DEBUG:
+            logger.error(message)
+        raise InvalidKeyLengthException(message)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_aead_for(algorithm: str, key: bytes):
+    """
+    Shared AEAD pool keyed by (algorithm, key). Several EncryptedField
+    columns on the same model (or across models) usually share the one
+    settings key, so pooling here derives the key schedule once per
+    process instead of once per field instance. The cryptography AEAD
+    objects are thread-safe and reentrant, so sharing them is safe.
+
+    :param algorithm: the algorithm the AEAD must implement.
+    :param key: the key as bytes.
+    :return: a ChaCha20Poly1305/AESGCM instance, or None for algorithms
+    not backed by the cryptography package.
+    """
+    if algorithm == ALGORITHM_CHACHA20_POLY1305:
+        validate_key(key, valid_lengths=(32,), where='_get_aead_for')
+        return ChaCha20Poly1305(key)
+    if algorithm == ALGORITHM_AES_GCM:
+        validate_key(key, valid_lengths=(16, 24, 32), where='_get_aead_for')
+        return AESGCM(key)
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _decrypt_cached(field, encrypted_data: str, key: bytes,
+                    fallback_algorithm: typing.Optional[str]) -> str:
+    """
+    Process-local decrypt cache. When the same ciphertext is read several
+    times in a request (prefetch duplicates, admin list pages, serializer
+    re-reads) the full b64 + unpack + AEAD verification only runs once.
+    Memory is bounded by the LRU size and the cache is cleared through the
+    setting_changed signal (e.g. on key rotation in tests).
+
+    :param field: the EncryptedField instance (fields are hashable and
+    live for the process lifetime).
+    :param encrypted_data: the stored envelope as string.
+    :param key: the key as bytes.
+    :param fallback_algorithm: the settings algorithm used for rows that
+    hide theirs.
+    :return: the original plaintext as string.
+    """
+    return field._decrypt(encrypted_data, key, fallback_algorithm)
+
+
+##############################################################################
+# Encryption primitives. Parameters are typed (type hintin). The encrypt
+# primitives return the packed binary envelope (see _pack) and the decrypt
+# primitives take the raw parts (nonce, ciphertext, tag) as bytes, already
+# split by _unpack or by the legacy JSON path in EncryptedField.decrypt.
 ##############################################################################
-def encrypt_chacha20_poly(data: str, header: bytes, key: bytes, hide_algorithm: bool = False) -> str:
+def encrypt_chacha20_poly(data: str, header: bytes, key: bytes,
+                          hide_algorithm: bool = False,
+                          aead: typing.Optional[ChaCha20Poly1305] = None,
+                          nonce: typing.Optional[bytes] = None) -> str:
     """
     Primitive to encrypt with ChaCha20 Poly1305.
 
@@ -142,94 +415,67 @@ def encrypt_chacha20_poly(data: str, header: bytes, key: bytes, hide_algorithm:
     :param key: the hey (must be 32 bytes long). Bytes.
     :param hide_algorithm: set to True if we want to remove details about
     the algorithm in the database.
-    :return: a string including a JSON/Dict object with the results.
+    :param aead: optional. An already built ChaCha20Poly1305 object for
+    this key, to avoid re-deriving the key schedule on every call.
+    :param nonce: optional. A caller-provided 12-byte nonce (must be
+    unique per key); generated with os.urandom when not passed.
+    :return: a string with the packed binary envelope, b64-encoded.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_chacha20_poly: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_chacha20_poly: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_chacha20_poly: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_chacha20_poly: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='encrypt_chacha20_poly')
 
     algorithm = ALGORITHM_CHACHA20_POLY1305
-    cipher = ChaCha20_Poly1305.new(key=key)
-    cipher.update(header)
-    ciphertext, tag = cipher.encrypt_and_digest(str.encode(data))
-
-    dict_values = dict()
     # Nonce will be 12 bytes long for ChaCha20 Poly1305 by default.
     # In future releases will add support for XChaCha passing 24 bytes.
-    dict_values['nonce'] = b64encode(cipher.nonce).decode('utf-8')
-    dict_values['header'] = b64encode(header).decode('utf-8')
-    dict_values['ciphertext'] = b64encode(ciphertext).decode('utf-8')
+    if nonce is None:
+        nonce = os.urandom(12)
+    if aead is None:
+        aead = ChaCha20Poly1305(key)
+    # The AEAD returns ciphertext||tag in a single call into OpenSSL.
+    buffer = aead.encrypt(nonce, _to_bytes(data), header)
+    ciphertext = buffer[:-16]
     # Tag must be used to validate the integrity.
-    dict_values['tag'] = b64encode(tag).decode('utf-8')
-
-    if hide_algorithm is False:
-        dict_values['algorithm'] = algorithm
+    tag = buffer[-16:]
 
-    return json.dumps(dict_values)
+    return _pack(algorithm, nonce, tag, ciphertext,
+                 hide_algorithm=hide_algorithm)
 
 
-def decrypt_chacha20_poly(encrypted_data: dict, key: bytes) -> str:
+def decrypt_chacha20_poly(nonce: bytes, ciphertext: bytes, tag: bytes,
+                          header: bytes, key: bytes,
+                          aead: typing.Optional[ChaCha20Poly1305] = None) -> str:
     """
     Primitive to decrypt with ChaCha20 Poly1305.
 
     This is the default if not changed when creating the field. It is an
     stream cipher with authenticated data, to prevent integrity problems.
 
-    encrypted_data will have:
-    - 'nonce', 'header', 'ciphertext' and 'tag'.
-
-    :param encrypted_data: the dictionary with all relevant details to be
-    to decrypt.
+    :param nonce: the nonce. Bytes.
+    :param ciphertext: the encrypted data. Bytes.
+    :param tag: the integrity tag. Bytes.
+    :param header: the header the data was encrypted with. Bytes.
     :param key: the hey (must be 32 bytes long). Bytes.
+    :param aead: optional. An already built ChaCha20Poly1305 object for
+    this key, to avoid re-deriving the key schedule on every call.
     :return: the original plaintext as string.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_chacha20_poly: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_chacha20_poly: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_chacha20_poly: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_chacha20_poly: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
-
-    nonce = b64decode(encrypted_data['nonce'])
-    header = b64decode(encrypted_data['header'])
-    ciphertext = b64decode(encrypted_data['ciphertext'])
-    tag = b64decode(encrypted_data['tag'])
-
-    cipher = ChaCha20_Poly1305.new(key=key, nonce=nonce)
-    cipher.update(header)
-    plaintext = cipher.decrypt_and_verify(ciphertext, tag)
-    return plaintext.decode("utf-8")
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='decrypt_chacha20_poly')
+
+    if aead is None:
+        aead = ChaCha20Poly1305(key)
+    try:
+        plaintext = aead.decrypt(nonce, ciphertext + tag, header)
+    except InvalidTag:
+        message = 'decrypt_chacha20_poly: MAC check failed (tampered data or wrong key).'
+        if _DEBUG:
+            logger.error(message)
+        raise InvalidEncryptedDataException(message)
+    return plaintext.decode()
 
 
 def encrypt_chacha20(data: str, key: bytes, hide_algorithm: bool = False) -> str:
@@ -244,82 +490,39 @@ def encrypt_chacha20(data: str, key: bytes, hide_algorithm: bool = False) -> str
     the algorithm in the database.
     :return: a string including a JSON/Dict object with the results.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_chacha20: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_chacha20: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_chacha20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_chacha20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='encrypt_chacha20')
 
     algorithm = ALGORITHM_CHACHA20
-    cipher = ChaCha20.new(key=key)
-    ciphertext = cipher.encrypt(str.encode(data))
-
-    dict_values = dict()
     # Nonce will be 8 bytes long for ChaCha20 by default.
     # In future releases will add support for XChaCha passing 24 bytes.
-    dict_values['nonce'] = b64encode(cipher.nonce).decode('utf-8')
-    dict_values['ciphertext'] = b64encode(ciphertext).decode('utf-8')
-
-    if hide_algorithm is False:
-        dict_values['algorithm'] = algorithm
+    cipher = ChaCha20.new(key=key)
+    ciphertext = cipher.encrypt(_to_bytes(data))
 
-    return json.dumps(dict_values)
+    return _pack(algorithm, cipher.nonce, b'', ciphertext,
+                 hide_algorithm=hide_algorithm)
 
 
-def decrypt_chacha20(encrypted_data: dict, key: bytes) -> str:
+def decrypt_chacha20(nonce: bytes, ciphertext: bytes, key: bytes) -> str:
     """
     Primitive to decrypt with ChaCha20.
 
     It is an stream cipher.
 
-    encrypted_data will have:
-    - 'nonce' and 'ciphertext'.
-
-    :param encrypted_data: the dictionary with all relevant details to be
-    to decrypt.
+    :param nonce: the nonce. Bytes.
+    :param ciphertext: the encrypted data. Bytes.
     :param key: the hey (must be 32 bytes long). Bytes.
     :return: the original plaintext as string.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_chacha20: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_chacha20: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_chacha20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_chacha20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
-    nonce = b64decode(encrypted_data['nonce'])
-    ciphertext = b64decode(encrypted_data['ciphertext'])
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='decrypt_chacha20')
     cipher = ChaCha20.new(key=key, nonce=nonce)
     plaintext = cipher.decrypt(ciphertext)
-    return plaintext.decode("utf-8")
+    return plaintext.decode()
 
 
 def encrypt_salsa20(data: str, key: bytes, hide_algorithm: bool = False) -> str:
@@ -334,86 +537,44 @@ def encrypt_salsa20(data: str, key: bytes, hide_algorithm: bool = False) -> str:
     the algorithm in the database.
     :return: a string including a JSON/Dict object with the results.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_salsa20: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_salsa20: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_salsa20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_salsa20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='encrypt_salsa20')
 
     algorithm = ALGORITHM_SALSA20
+    # Nonce will be 8 bytes long for Salsa20 by default.
     cipher = Salsa20.new(key=key)
-    ciphertext = cipher.encrypt(str.encode(data))
+    ciphertext = cipher.encrypt(_to_bytes(data))
 
-    dict_values = dict()
-    # Nonce will be 8 bytes long for ChaCha20 by default.
-    # In future releases will add support for XChaCha passing 24 bytes.
-    dict_values['nonce'] = b64encode(cipher.nonce).decode('utf-8')
-    dict_values['ciphertext'] = b64encode(ciphertext).decode('utf-8')
-
-    if hide_algorithm is False:
-        dict_values['algorithm'] = algorithm
-
-    return json.dumps(dict_values)
+    return _pack(algorithm, cipher.nonce, b'', ciphertext,
+                 hide_algorithm=hide_algorithm)
 
 
-def decrypt_salsa20(encrypted_data: dict, key: bytes) -> str:
+def decrypt_salsa20(nonce: bytes, ciphertext: bytes, key: bytes) -> str:
     """
     Primitive to decrypt with Salsa20.
 
     It is an stream cipher.
 
-    encrypted_data will have:
-    - 'nonce' and 'ciphertext'.
-
-    :param encrypted_data: the dictionary with all relevant details to be
-    to decrypt.
+    :param nonce: the nonce. Bytes.
+    :param ciphertext: the encrypted data. Bytes.
     :param key: the hey (must be 32 bytes long). Bytes.
     :return: the original plaintext as string.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_salsa20: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_salsa20: key must be BYTES.'
-        )
-
-    # key must be 32 bytes long.
-    key_len = len(key)
-    if key_len != 32:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_salsa20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_salsa20: key must be 32 bytes/256 bit long. You passed [%d] bytes.' % key_len
-        )
-    nonce = b64decode(encrypted_data['nonce'])
-    ciphertext = b64decode(encrypted_data['ciphertext'])
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(32,), where='decrypt_salsa20')
     cipher = Salsa20.new(key=key, nonce=nonce)
     plaintext = cipher.decrypt(ciphertext)
-    return plaintext.decode("utf-8")
+    return plaintext.decode()
 
 
 def encrypt_aes(data: str, header: bytes, key: bytes,
-                algorithm: str = ALGORITHM_AES_GCM, hide_algorithm: bool = False) -> str:
+                algorithm: str = ALGORITHM_AES_GCM, hide_algorithm: bool = False,
+                aead: typing.Optional[AESGCM] = None,
+                nonce: typing.Optional[bytes] = None) -> str:
     """
     Primitive to encrypt with AES in several modes.
 
@@ -427,146 +588,99 @@ def encrypt_aes(data: str, header: bytes, key: bytes,
     :param key: the hey (must be 32 bytes long). Bytes.
     :param hide_algorithm: set to True if we want to remove details about
     the algorithm in the database.
-    :return: a string including a JSON/Dict object with the results.
+    :param aead: optional. An already built AESGCM object for this key,
+    to avoid re-deriving the key schedule on every call (GCM mode only).
+    :param nonce: optional. A caller-provided 12-byte nonce (must be
+    unique per key, GCM mode only); generated with os.urandom when not
+    passed.
+    :return: a string with the packed binary envelope, b64-encoded.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_aes: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_aes: key must be BYTES.'
-        )
-
-    # key must be 16, 24 or 32 bytes long.
-    key_len = len(key)
-    if key_len not in AES_VALID_KEY_SIZES_IN_LEN:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_AES: key must be 16, 24 or 32 bytes bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'encrypt_AES: key must be 16, 24 or 32 bytes bit long. You passed [%d] bytes.' % key_len
-        )
-
-    # Default mode.
-    mode = AES.MODE_GCM
-
-    if algorithm == ALGORITHM_AES_GCM:
-        mode = AES.MODE_GCM
-    elif algorithm == ALGORITHM_AES_SIV:
-        mode = AES.MODE_SIV
-    elif algorithm == ALGORITHM_AES_EAX:
-        mode = AES.MODE_EAX
-    elif algorithm == ALGORITHM_AES_CCM:
-        mode = AES.MODE_CCM
-    elif algorithm == ALGORITHM_AES_OCB:
-        mode = AES.MODE_OCB
-    else:
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypt_AES: invalid algorithm passed [%s].' % str(algorithm)
-            )
-        raise AESInvalidAlgorithmException(
-            'encrypt_AES: invalid algorithm passed [%s].' % str(algorithm)
-        )
-
-    if settings.UNIT_TESTING is True:
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(16, 24, 32), where='encrypt_aes')
+
+    mode = _AES_MODES.get(algorithm)
+    if mode is None:
+        message = 'encrypt_AES: invalid algorithm passed [%s].' % str(algorithm)
+        if _DEBUG:
+            logger.error(message)
+        raise AESInvalidAlgorithmException(message)
+
+    if _UNIT_TESTING:
         logger.critical('encrypt_AES: header=[%s] MODE=[%s]' % (header, mode))
 
-    if algorithm == ALGORITHM_AES_SIV:
-        # SIV without a nonce becomes DETERMINISTIC, and we don't want that.
-        # So we generate a nonce with get_random_bytes
-        cipher = AES.new(key=key, mode=mode, nonce=get_random_bytes(16))
+    if algorithm == ALGORITHM_AES_GCM:
+        # GCM goes through OpenSSL EVP (AES-NI + PCLMULQDQ for GHASH),
+        # returning ciphertext||tag in a single call.
+        if nonce is None:
+            nonce = os.urandom(12)
+        if aead is None:
+            aead = AESGCM(key)
+        buffer = aead.encrypt(nonce, _to_bytes(data), header)
+        ciphertext = buffer[:-16]
+        tag = buffer[-16:]
     else:
-        cipher = AES.new(key=key, mode=mode)
+        if algorithm == ALGORITHM_AES_SIV:
+            # SIV without a nonce becomes DETERMINISTIC, and we don't want
+            # that. So we generate a nonce with get_random_bytes
+            cipher = AES.new(key=key, mode=mode, nonce=get_random_bytes(16))
+        else:
+            cipher = AES.new(key=key, mode=mode)
 
-    cipher.update(header)
-    ciphertext, tag = cipher.encrypt_and_digest(str.encode(data))
+        cipher.update(header)
+        ciphertext, tag = cipher.encrypt_and_digest(_to_bytes(data))
+        nonce = cipher.nonce
 
-    dict_values = dict()
-    dict_values['nonce'] = b64encode(cipher.nonce).decode('utf-8')
-    dict_values['header'] = b64encode(header).decode('utf-8')
-    dict_values['ciphertext'] = b64encode(ciphertext).decode('utf-8')
-    # Tag must be used to validate the integrity.
-    dict_values['tag'] = b64encode(tag).decode('utf-8')
+    return _pack(algorithm, nonce, tag, ciphertext,
+                 hide_algorithm=hide_algorithm)
 
-    if hide_algorithm is False:
-        dict_values['algorithm'] = algorithm
 
-    return json.dumps(dict_values)
-
-
-def decrypt_aes(encrypted_data: dict, key: bytes) -> str:
+def decrypt_aes(nonce: bytes, ciphertext: bytes, tag: bytes,
+                header: bytes, key: bytes,
+                mode: int = AES.MODE_GCM,
+                aead: typing.Optional[AESGCM] = None) -> str:
     """
     Primitive to decrypt with AES in different modes.
 
     It is an stream cipher with authenticated data.
 
-    encrypted_data will have:
-    - 'nonce', 'header', 'ciphertext' and 'tag'.
-
-    :param encrypted_data: the dictionary with all relevant details to be
-    to decrypt.
+    :param nonce: the nonce. Bytes.
+    :param ciphertext: the encrypted data. Bytes.
+    :param tag: the integrity tag. Bytes.
+    :param header: the header the data was encrypted with. Bytes.
     :param key: the hey (must be 32 bytes long). Bytes.
+    :param mode: the AES mode, already resolved by the caller through
+    _AES_MODES. Defaults to AES.MODE_GCM.
+    :param aead: optional. An already built AESGCM object for this key,
+    to avoid re-deriving the key schedule on every call (GCM mode only).
     :return: the original plaintext as string.
     """
-    # key must be BYTES
-    if isinstance(key, (bytes, bytearray)) is not True:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_aes: key must be BYTES.'
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_aes: key must be BYTES.'
-        )
-
-    # key must be 16, 24 or 32 bytes long.
-    key_len = len(key)
-    if key_len not in AES_VALID_KEY_SIZES_IN_LEN:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_aes: key must be 16, 24 or 32 bytes bit long. You passed [%d] bytes.' % key_len
-            )
-        raise InvalidKeyLengthException(
-            'decrypt_aes: key must be 16, 24 or 32 bytes bit long. You passed [%d] bytes.' % key_len
-        )
-
-    mode = None
-    nonce = b64decode(encrypted_data['nonce'])
-    header = b64decode(encrypted_data['header'])
-    ciphertext = b64decode(encrypted_data['ciphertext'])
-    tag = b64decode(encrypted_data['tag'])
-    algorithm = encrypted_data['algorithm']
-
-    if settings.UNIT_TESTING is True:
-        logger.critical('decrypt_AES: using algorithm [%s].' % algorithm)
-        logger.critical('decrypt_AES: Encrypted data [%s].' % encrypted_data)
-
-    if algorithm == ALGORITHM_AES_GCM:
-        mode = AES.MODE_GCM
-    elif algorithm == ALGORITHM_AES_SIV:
-        mode = AES.MODE_SIV
-    elif algorithm == ALGORITHM_AES_EAX:
-        mode = AES.MODE_EAX
-    elif algorithm == ALGORITHM_AES_CCM:
-        mode = AES.MODE_CCM
-    elif algorithm == ALGORITHM_AES_OCB:
-        mode = AES.MODE_OCB
-    else:
-        if settings.DEBUG is True:
-            logger.error(
-                'decrypt_AES: invalid algorithm passed [%s].' % str(algorithm)
-            )
-        raise AESInvalidAlgorithmException(
-            'decrypt_AES: invalid algorithm passed [%s].' % str(algorithm)
-        )
-
-    cipher = AES.new(key, mode, nonce=nonce)
-    cipher.update(header)
-    plaintext = cipher.decrypt_and_verify(ciphertext, tag)
-    return plaintext.decode("utf-8")
+    if __debug__:
+        # Redundant when called through EncryptedField, which already
+        # validated the key; stripped under python -O.
+        validate_key(key, valid_lengths=(16, 24, 32), where='decrypt_aes')
+
+    if _UNIT_TESTING:
+        logger.critical('decrypt_AES: using MODE [%s].' % mode)
+
+    try:
+        if mode == AES.MODE_GCM:
+            if aead is None:
+                aead = AESGCM(key)
+            plaintext = aead.decrypt(nonce, ciphertext + tag, header)
+        else:
+            cipher = AES.new(key, mode, nonce=nonce)
+            cipher.update(header)
+            plaintext = cipher.decrypt_and_verify(ciphertext, tag)
+    except (InvalidTag, ValueError):
+        # The two backends disagree on the failure type (InvalidTag vs
+        # ValueError): normalize to the package exception.
+        message = 'decrypt_AES: MAC check failed (tampered data or wrong key).'
+        if _DEBUG:
+            logger.error(message)
+        raise InvalidEncryptedDataException(message)
+    return plaintext.decode()
 
 
 class EncryptedField(models.Field):
@@ -590,11 +704,55 @@ class EncryptedField(models.Field):
     _internal_type: str = 'TextField'
     _header: typing.Optional[bytes] = b'JDDjangoEncryptedField'
     _key: bytes = None
+    # Opt-in deterministic nonce construction (RFC 5116 section 3.2):
+    # random 4-byte prefix + 64-bit counter, one getrandom syscall per
+    # process instead of one per row. Off by default.
+    _bulk_nonce: typing.Optional[bool] = False
+    _nonce_prefix: typing.Optional[bytes] = None
+    _nonce_counter = None
+
+    # Algorithm -> primitive dispatch tables. A single dict lookup replaces
+    # the if/elif ladders in encrypt/decrypt (O(1) hash instead of up to
+    # eight string comparisons per row).
+    _ENCRYPT_DISPATCH = {
+        ALGORITHM_CHACHA20_POLY1305: lambda self, data, key: encrypt_chacha20_poly(
+            data=data, header=self._header, key=key,
+            hide_algorithm=self._hide_algorithm,
+            aead=self._get_aead(key, self._algorithm),
+            nonce=self._make_nonce()),
+        ALGORITHM_CHACHA20: lambda self, data, key: encrypt_chacha20(
+            data=data, key=key, hide_algorithm=self._hide_algorithm),
+        ALGORITHM_SALSA20: lambda self, data, key: encrypt_salsa20(
+            data=data, key=key, hide_algorithm=self._hide_algorithm),
+        **{aes_algorithm: lambda self, data, key: encrypt_aes(
+            data=data, header=self._header, key=key,
+            algorithm=self._algorithm,
+            hide_algorithm=self._hide_algorithm,
+            aead=self._get_aead(key, self._algorithm),
+            nonce=self._make_nonce())
+           for aes_algorithm in ALGORITHM_AES_ALGORITHMS},
+    }
+
+    _DECRYPT_DISPATCH = {
+        ALGORITHM_CHACHA20_POLY1305: lambda self, key, algorithm, nonce, ciphertext, tag, header: decrypt_chacha20_poly(
+            nonce=nonce, ciphertext=ciphertext, tag=tag, header=header,
+            key=key, aead=self._get_aead(key, algorithm)),
+        ALGORITHM_CHACHA20: lambda self, key, algorithm, nonce, ciphertext, tag, header: decrypt_chacha20(
+            nonce=nonce, ciphertext=ciphertext, key=key),
+        ALGORITHM_SALSA20: lambda self, key, algorithm, nonce, ciphertext, tag, header: decrypt_salsa20(
+            nonce=nonce, ciphertext=ciphertext, key=key),
+        **{aes_algorithm: lambda self, key, algorithm, nonce, ciphertext, tag, header: decrypt_aes(
+            nonce=nonce, ciphertext=ciphertext, tag=tag, header=header,
+            key=key, mode=_AES_MODES[algorithm],
+            aead=self._get_aead(key, algorithm))
+           for aes_algorithm in ALGORITHM_AES_ALGORITHMS},
+    }
 
     def __init__(self,
                  header: typing.Optional[bytes] = None,
                  algorithm: typing.Optional[str] = ALGORITHM_CHACHA20_POLY1305,
                  hide_algorithm: typing.Optional[bool] = False,
+                 bulk_nonce: typing.Optional[bool] = False,
                  *args, **kwargs):
         """
         __init__ function to set the field. The only relevant parameter here
@@ -604,11 +762,19 @@ class EncryptedField(models.Field):
         to a True value, will raise an Exception.
 
         :param header: optional. The initiation header for the algorithm.
+        :param bulk_nonce: optional. Use a per-field random prefix plus a
+        monotonic counter for nonces instead of os.urandom per row. Only
+        for the 96-bit-nonce AEADs (ChaCha20 Poly1305 and AES GCM); nonces
+        stay unique per key, which is what these AEADs require.
         :param args: variable arguments.
         :param kwargs: variable arguments in a dictionary.
         """
-        # If header is passed
+        # If header is passed. Normalized to bytes once here: the packed
+        # envelope no longer stores the header per row, so construction is
+        # the only place any header conversion ever happens.
         if header:
+            if isinstance(header, str):
+                header = header.encode('utf-8')
             self._header = header
 
         # The encryption algorithm to use. By default: ALGORITHM_CHACHA20_POLY1305
@@ -616,58 +782,118 @@ class EncryptedField(models.Field):
             if algorithm in ALLOWED_ENCRYPTION_ALGORITHMS:
                 self._algorithm = algorithm
             else:
-                if settings.DEBUG is True:
-                    logger.error(
-                        "%s does not support this algorithm [%s]." % (self.__class__.__name__,
-                                                                      str(algorithm))
-                    )
-                raise ImproperlyConfigured(
-                    "%s does not support primary_key different from False (or None)."
-                    % self.__class__.__name__
-                )
+                message = "%s does not support this algorithm [%s]." % (
+                    self.__class__.__name__, str(algorithm))
+                if _DEBUG:
+                    logger.error(message)
+                raise ImproperlyConfigured(message)
 
         # If we want to store only data, not the encryption algorithm details.
         if hide_algorithm is True:
             self._hide_algorithm = True
 
+        # Deterministic nonce mode must be explicit and only makes sense
+        # for the AEADs that take a 96-bit nonce.
+        if bulk_nonce is True:
+            if self._algorithm not in (ALGORITHM_CHACHA20_POLY1305,
+                                       ALGORITHM_AES_GCM):
+                message = "%s only supports bulk_nonce with ChaCha20 Poly1305 or AES GCM." % self.__class__.__name__
+                if _DEBUG:
+                    logger.error(message)
+                raise ImproperlyConfigured(message)
+            self._bulk_nonce = True
+            self._nonce_prefix = os.urandom(4)
+            self._nonce_counter = itertools.count()
+
         # Note: primary_key must not be set to True in anyway. This field
         # is not viable for this purpose.
         primary_key = kwargs.get('primary_key', False)
         if primary_key:
-            if settings.DEBUG is True:
-                logger.error(
-                    "%s does not support primary_key different from False (or None)." % self.__class__.__name__
-                )
-            raise ImproperlyConfigured(
-                "%s does not support primary_key different from False (or None)." % self.__class__.__name__
-            )
+            message = "%s does not support primary_key different from False (or None)." % self.__class__.__name__
+            if _DEBUG:
+                logger.error(message)
+            raise ImproperlyConfigured(message)
 
         # Note: unique must not be set to True in anyway. This field
         # is not viable for this purpose.
         unique = kwargs.get('unique', False)
         if unique:
-            if settings.DEBUG is True:
-                logger.error(
-                    "%s does not support unique different from False (or None)." % self.__class__.__name__
-                )
-            raise ImproperlyConfigured(
-                "%s does not support unique different from False (or None)." % self.__class__.__name__
-            )
+            message = "%s does not support unique different from False (or None)." % self.__class__.__name__
+            if _DEBUG:
+                logger.error(message)
+            raise ImproperlyConfigured(message)
 
         # Note: db_index must not be set to True in anyway. This field
         # is not viable for this purpose.
         db_index = kwargs.get('db_index', False)
         if db_index is True:
-            if settings.DEBUG is True:
-                logger.error(
-                    "%s does not support db_index different from False (or None)." % self.__class__.__name__
-                )
-            raise ImproperlyConfigured(
-                "%s does not support db_index different from False (or None)." % self.__class__.__name__
-            )
+            message = "%s does not support db_index different from False (or None)." % self.__class__.__name__
+            if _DEBUG:
+                logger.error(message)
+            raise ImproperlyConfigured(message)
 
         super().__init__(*args, **kwargs)
 
+    def _get_aead(self, key: bytes, algorithm: str):
+        """
+        Fetch the AEAD object for this key/algorithm from the shared
+        module-level pool, validating the key once per key instead of
+        once per row. Only the algorithms backed by the cryptography
+        package have an AEAD object; for the rest None is returned and
+        the primitives work as before.
+
+        :param key: the key as bytes.
+        :param algorithm: the algorithm the AEAD must implement.
+        :return: a ChaCha20Poly1305/AESGCM instance, or None.
+        """
+        # bytes(key) is a no-op for bytes and makes bytearray keys
+        # hashable for the pool.
+        return _get_aead_for(algorithm, bytes(key))
+
+    def _make_nonce(self) -> typing.Optional[bytes]:
+        """
+        Build the next deterministic nonce when bulk_nonce is enabled:
+        4-byte random prefix plus a 64-bit little-endian counter, unique
+        per key for the process lifetime. Returns None otherwise so the
+        primitives fall back to os.urandom per row.
+
+        :return: a 12-byte nonce, or None.
+        """
+        if self._bulk_nonce is not True:
+            return None
+        return self._nonce_prefix + struct.pack('<Q', next(self._nonce_counter))
+
+    def _get_key(self, where: str) -> bytes:
+        """
+        Read the key from settings, shared by encrypt/decrypt/encrypt_many.
+
+        :param where: the caller name, used to prefix error messages.
+        :return: the key as bytes.
+        """
+        try:
+            key = settings.DJANGO_ENCRYPTED_FIELD_KEY
+        except Exception:
+            message = 'encrypted-field.%s: settings.DJANGO_ENCRYPTED_FIELD_KEY not found. The key is mandatory.' % where
+            if _DEBUG:
+                logger.error(message)
+            raise MissingKeyException(message)
+
+        # Validate type and length here for every algorithm, not only the
+        # ones that go through _get_aead: the PyCryptodome-backed ciphers
+        # would otherwise leak their own ValueError on a bad key.
+        if self._algorithm in ALGORITHM_AES_ALGORITHMS:
+            valid_lengths = (16, 24, 32)
+        else:
+            valid_lengths = (32,)
+        validate_key(key, valid_lengths=valid_lengths, where=where)
+
+        # Normalize once: bytes(key) is a no-op for bytes and turns a
+        # bytearray key hashable for the lru_cache'd decrypt/AEAD pools.
+        if type(key) is not bytes:
+            key = bytes(key)
+
+        return key
+
     def encrypt(self, data: str) -> str:
         """
         The encryption function. We opted for a simpler approach, letting the
@@ -683,53 +909,57 @@ class EncryptedField(models.Field):
         :return: will return a string including all the required elements and
         the encrypted string in a dictionary.
         """
-        key = None
-        try:
-            key = settings.DJANGO_ENCRYPTED_FIELD_KEY
-        except Exception as e:
-            if settings.DEBUG is True:
-                logger.error(
-                    'encrypted-field.encrypt: settings.DJANGO_ENCRYPTED_FIELD_KEY not found. The key is mandatory to be able to encrypt.'
-                )
-            raise MissingKeyException(
-                'encrypted-field.encrypt: settings.DJANGO_ENCRYPTED_FIELD_KEY not found. The key is mandatory.'
-            )
+        key = self._get_key('encrypt')
 
-        # key must be BYTES
-        if isinstance(key, (bytes, bytearray)) is not True:
-            if settings.DEBUG is True:
-                logger.error(
-                    'encrypt: key must be BYTES.'
-                )
-            raise InvalidKeyLengthException(
-                'encrypt: key must be BYTES.'
-            )
+        encrypt_func = self._ENCRYPT_DISPATCH.get(self._algorithm)
+        if encrypt_func is not None:
+            return encrypt_func(self, data, key)
 
-        if self._algorithm == ALGORITHM_CHACHA20_POLY1305:
-            return encrypt_chacha20_poly(data=data,
-                                         header=self._header,
-                                         key=key,
-                                         hide_algorithm=self._hide_algorithm)
-        elif self._algorithm == ALGORITHM_CHACHA20:
-            return encrypt_chacha20(data=data,
-                                    key=key,
-                                    hide_algorithm=self._hide_algorithm)
-        elif self._algorithm == ALGORITHM_SALSA20:
-            return encrypt_salsa20(data=data,
-                                   key=key,
-                                   hide_algorithm=self._hide_algorithm)
-        elif self._algorithm in ALGORITHM_AES_ALGORITHMS:
-            return encrypt_aes(data=data,
-                               header=self._header,
-                               key=key,
-                               algorithm=self._algorithm,
-                               hide_algorithm=self._hide_algorithm)
-
-        if settings.DEBUG is True:
-            logger.info('encrypted-field: unknown algorithm when calling encrypt: [%s].' % str(self._algorithm))
-        raise UnknownAlgorithmException(
-            'encrypted-field: unknown algorithm when calling encrypt: [%s].' % str(self._algorithm)
-        )
+        message = 'encrypted-field: unknown algorithm when calling encrypt: [%s].' % str(self._algorithm)
+        if _DEBUG:
+            logger.info(message)
+        raise UnknownAlgorithmException(message)
+
+    def encrypt_many(self, values: typing.List[str]) -> typing.List[str]:
+        """
+        Batch variant of encrypt for bulk pipelines (bulk_create and
+        friends already route each row through get_db_prep_save, so this
+        is for callers preparing the ciphertext themselves).
+
+        One cached AEAD object is reused for the whole batch and all the
+        nonces come from a single os.urandom call, so the key schedule
+        and the getrandom syscall are amortized over N values instead of
+        being paid per row.
+
+        :param values: the plaintext values, as strings.
+        :return: a list of encrypted envelopes, in the same order.
+        """
+        key = self._get_key('encrypt_many')
+        aead = self._get_aead(key, self._algorithm)
+        if aead is None:
+            # Algorithms without a cryptography AEAD object just loop over
+            # the per-value primitive.
+            return [self.encrypt(value) for value in values]
+
+        algorithm = self._algorithm
+        header = self._header
+        hide_algorithm = self._hide_algorithm
+        nonces = None
+        if self._bulk_nonce is not True:
+            nonces = os.urandom(12 * len(values))
+
+        encrypted_values = []
+        for index, value in enumerate(values):
+            if nonces is None:
+                nonce = self._make_nonce()
+            else:
+                nonce = nonces[index * 12:(index + 1) * 12]
+            buffer = aead.encrypt(nonce, _to_bytes(value), header)
+            encrypted_values.append(
+                _pack(algorithm, nonce, buffer[-16:], buffer[:-16],
+                      hide_algorithm=hide_algorithm)
+            )
+        return encrypted_values
 
     def decrypt(self, encrypted_data: str) -> str:
         """
@@ -737,72 +967,90 @@ class EncryptedField(models.Field):
         the encrypted data as string. Then conversion to bytes will be
         performed in the specific functions to be able to operate.
 
+        Results go through a process-local LRU cache keyed on the stored
+        envelope and the key, so repeated reads of the same row skip the
+        b64 + AEAD verification entirely.
+
         :param encrypted_data: the encrypted data we want to decrypt.
         :return: will return a string with the decrypted data.
         """
+        key = self._get_key('decrypt')
+        fallback_algorithm = getattr(
+            settings, 'DJANGO_ENCRYPTED_FIELD_ALGORITHM', None
+        )
+        return _decrypt_cached(self, encrypted_data, key, fallback_algorithm)
+
+    def _decrypt(self, encrypted_data: str, key: bytes,
+                 fallback_algorithm: typing.Optional[str]) -> str:
+        """
+        The real decrypt work, called through _decrypt_cached on misses.
+
+        :param encrypted_data: the encrypted data we want to decrypt.
+        :param key: the key as bytes, already validated.
+        :param fallback_algorithm: the settings algorithm used for rows
+        that hide theirs.
+        :return: will return a string with the decrypted data.
+        """
         data_b64_fields = None
         algorithm = None
 
-        key = None
-        try:
-            key = settings.DJANGO_ENCRYPTED_FIELD_KEY
-        except Exception as e:
-            if settings.DEBUG is True:
-                logger.error(
-                    'encrypted-field.decrypt: settings.DJANGO_ENCRYPTED_FIELD_KEY not found. The key is mandatory to be able to decrypt.'
-                )
-            raise MissingKeyException(
-                'encrypted-field.decrypt: settings.DJANGO_ENCRYPTED_FIELD_KEY not found. The key is mandatory.'
-            )
-
-        # key must be BYTES
-        if isinstance(key, (bytes, bytearray)) is not True:
-            if settings.DEBUG is True:
-                logger.error(
-                    'decrypt: key must be BYTES.'
-                )
-            raise InvalidKeyLengthException(
-                'decrypt: key must be BYTES.'
-            )
+        if encrypted_data.startswith('{'):
+            # Legacy JSON envelope (rows written before the packed binary
+            # framing). Every part is b64-encoded on its own.
+            try:
+                data_b64_fields = _json_loads(encrypted_data)
+            except Exception as e:
+                # Fail loudly and early: falling through with None used to
+                # crash later with an unrelated AttributeError, repeating
+                # the parse work on every read of the corrupt row.
+                message = 'encrypted_field.decrypt: encrypted_data does not load as JSON/Dict [%s].' % str(e)
+                if _DEBUG:
+                    logger.error(message)
+                raise InvalidEncryptedDataException(message)
 
-        try:
-            data_b64_fields = json.loads(encrypted_data)
-        except Exception as e:
-            if settings.DEBUG is True:
-                logger.error(
-                    'encrypted_field.decrypt: encrypted_data doest not loads as JSON/Dict.'
-                )
-                logger.error('encrypted_field.decrypt: exception [%s]' % str(e))
-                return None
-
-        if 'algorithm' in data_b64_fields.keys():
             algorithm = data_b64_fields.get('algorithm', None)
-
-        if not algorithm:
+            nonce = b64decode(data_b64_fields['nonce'])
+            ciphertext = b64decode(data_b64_fields['ciphertext'])
+            tag = b''
+            if 'tag' in data_b64_fields:
+                tag = b64decode(data_b64_fields['tag'])
+            # ChaCha20 and Salsa20 never authenticate a header, so do not
+            # waste a b64decode on those rows.
+            header = self._header
+            if algorithm not in ALGORITHM_STREAM_ALGORITHMS \
+                    and 'header' in data_b64_fields:
+                header = b64decode(data_b64_fields['header'])
+        else:
+            # Packed binary envelope: one b64decode plus struct unpacking.
+            # The header is not stored, it is always the field's own.
             try:
-                algorithm = settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM
+                blob = b64decode(encrypted_data)
             except Exception as e:
-                if settings.DEBUG is True:
-                    logger.error(
-                        'encrypted_field.decrypt: algorithm UNKNOWN.'
-                    )
-                raise UnknownAlgorithmException('encrypted_field.decrypt: algorithm UNKNOWN.')
-
-        data_b64_fields['algorithm'] = algorithm
-        if algorithm == ALGORITHM_CHACHA20_POLY1305:
-            return decrypt_chacha20_poly(encrypted_data=data_b64_fields, key=key)
-        elif algorithm == ALGORITHM_CHACHA20:
-            return decrypt_chacha20(encrypted_data=data_b64_fields, key=key)
-        elif algorithm == ALGORITHM_SALSA20:
-            return decrypt_salsa20(encrypted_data=data_b64_fields, key=key)
-        elif algorithm in ALGORITHM_AES_ALGORITHMS:
-            return decrypt_aes(encrypted_data=data_b64_fields, key=key)
-
-        if settings.DEBUG is True:
-            logger.error(
-                'encrypted_field.decrypt: unsupported algorithm [%s]' % str(algorithm)
-            )
-        raise UnknownAlgorithmException('encrypted_field.decrypt: unsupported algorithm [%s]' % str(algorithm))
+                message = 'encrypted_field.decrypt: encrypted_data does not decode as base64 [%s].' % str(e)
+                if _DEBUG:
+                    logger.error(message)
+                raise InvalidEncryptedDataException(message)
+
+            algorithm, nonce, tag, ciphertext = _unpack(blob)
+            header = self._header
+
+        if not algorithm:
+            algorithm = fallback_algorithm
+            if not algorithm:
+                message = 'encrypted_field.decrypt: algorithm UNKNOWN.'
+                if _DEBUG:
+                    logger.error(message)
+                raise UnknownAlgorithmException(message)
+
+        decrypt_func = self._DECRYPT_DISPATCH.get(algorithm)
+        if decrypt_func is not None:
+            return decrypt_func(self, key, algorithm, nonce, ciphertext,
+                                tag, header)
+
+        message = 'encrypted_field.decrypt: unsupported algorithm [%s]' % str(algorithm)
+        if _DEBUG:
+            logger.error(message)
+        raise UnknownAlgorithmException(message)
 
     ##########################################################################
     # We need the following functions as intermediaries to the Django ORM/DB
@@ -822,4 +1070,9 @@ class EncryptedField(models.Field):
         if value == "" or value is None:
             return None
 
+        # Some backends hand the column back as memoryview/bytes instead
+        # of str. The envelope is b64, so ascii is always safe here.
+        if not isinstance(value, str):
+            value = bytes(value).decode('ascii')
+
         return self.to_python(self.decrypt(encrypted_data=value))
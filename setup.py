@@ -1,49 +1,65 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 
-long_description = (
-    open('README.md').read()
-)
-
-version = '1.0.4'
-
-
-setup(
-    name='django-encrypted-field',
-    description=(
-        'This is a Django Model Field class that can be '
-        'encrypted using ChaCha20 poly 1305, and other algorithms.'
-    ),
-    long_description=long_description,
-    long_description_content_type='text/markdown',
-    url='https://github.com/patowc/django-encrypted-field',
-    license='MIT',
-    author='Román Ramírez',
-    author_email='rramirez@rootedcon.com',
-    packages=find_packages(),
-    version=version,
-    install_requires=[
-        'Django>=4.0',
-        'pycryptodomex>=3.12.0'
-    ],
-    classifiers=[
-        'Environment :: Web Environment',
-        'Intended Audience :: Developers',
-        'License :: OSI Approved :: MIT License',
-        'Operating System :: OS Independent',
-        'Programming Language :: Python',
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: Implementation :: CPython',
-        'Programming Language :: Python :: Implementation :: PyPy',
-        'Framework :: Django',
-    ],
-    zip_safe=False,
-)
+HERE = Path(__file__).parent
+
+
+def read_text(filename):
+    # read_text opens and closes the handle deterministically, unlike the
+    # bare open().read() this file used before.
+    try:
+        return (HERE / filename).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return ''
+
+
+version = read_text('VERSION').strip() or '1.0.5'
+
+
+# Guarded so metadata-only introspection of this module does not pay the
+# README/CHANGES disk reads.
+if __name__ == '__main__':
+    long_description = read_text('README.md')
+
+    setup(
+        name='django-encrypted-field',
+        description=(
+            'This is a Django Model Field class that can be '
+            'encrypted using ChaCha20 poly 1305, and other algorithms.'
+        ),
+        long_description=long_description,
+        long_description_content_type='text/markdown',
+        url='https://github.com/patowc/django-encrypted-field',
+        license='MIT',
+        author='Román Ramírez',
+        author_email='rramirez@rootedcon.com',
+        packages=find_packages(),
+        version=version,
+        install_requires=[
+            'Django>=4.0',
+            'pycryptodomex>=3.12.0',
+            'cryptography>=36.0.0'
+        ],
+        classifiers=[
+            'Environment :: Web Environment',
+            'Intended Audience :: Developers',
+            'License :: OSI Approved :: MIT License',
+            'Operating System :: OS Independent',
+            'Programming Language :: Python',
+            'Programming Language :: Python :: 3',
+            'Programming Language :: Python :: 3.5',
+            'Programming Language :: Python :: 3.6',
+            'Programming Language :: Python :: 3.7',
+            'Programming Language :: Python :: 3.8',
+            'Programming Language :: Python :: 3.9',
+            'Programming Language :: Python :: Implementation :: CPython',
+            'Programming Language :: Python :: Implementation :: PyPy',
+            'Framework :: Django',
+        ],
+        zip_safe=False,
+    )
@@ -3,27 +3,65 @@ Tests module for django-encrypted-field package.
 
 """
 import os
-import sys
 import logging
 import unittest
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 
 import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
 from django.conf import settings
 django.setup()
 from django.core.management import call_command  # pylint: disable=E0402
+from django.db import transaction  # pylint: disable=E0402
+from django.test import TestCase  # pylint: disable=E0402
+from django.test.utils import setup_test_environment  # pylint: disable=E0402
 
 
 logger = logging.getLogger(__name__)
 
-app = 'tests'
 
-
-from encrypted_field.fields import *  # pylint: disable=E0402
-from tests.models import *  # pylint: disable=E0402
-
-
-class AllTests(unittest.TestCase):
+from encrypted_field.fields import (  # pylint: disable=E0402
+    EncryptedField,
+    InvalidKeyLengthException
+)
+from tests.models import (  # pylint: disable=E0402
+    MyModel,
+    MyModel2,
+    MyModel3,
+    MyModel4,
+    MyModel5,
+    MyModel6,
+    MyModel7,
+    MyModel8,
+    MyModel9
+)
+
+
+# Shared across the save tests: built once at import instead of per test
+# method. The field takes str and always decrypts back to str, so there
+# is no bytes fast-path to feed here.
+SECRET = 'A very critical secret.'
+
+# One row per model: the class, its encrypted attribute and the settings
+# algorithm the original per-model blocks pinned before saving (only the
+# hidden-algorithm model actually reads it back on decrypt).
+CASES = [
+    (MyModel, 'seed', 'CC20P'),
+    (MyModel2, 'seed_hidden', 'CC20P'),
+    (MyModel3, 'seed', 'CC20'),
+    (MyModel4, 'seed', 'SS20'),
+    (MyModel5, 'seed', 'AGCM'),
+    (MyModel6, 'seed', 'ASIV'),
+    (MyModel7, 'seed', 'AEAX'),
+    (MyModel8, 'seed', 'ACCM'),
+    (MyModel9, 'seed', 'AOCB'),
+]
+
+
+# django.test.TestCase wraps every test in a rolled-back transaction, so
+# rows never pile up between tests and no per-test DELETE sweep is needed.
+class AllTests(TestCase):
     def test_configuration(self):
         """
         Test configuration defaults.
@@ -56,113 +94,129 @@ class AllTests(unittest.TestCase):
         :return:  nothing as is a test case.
 
         """
-        base_model = MyModel()
-        self.assertNotEqual(base_model, None)
+        for model_cls, attr, algorithm in CASES:
+            with self.subTest(model=model_cls.__name__):
+                self.assertNotEqual(model_cls(), None)
 
-        base_model2 = MyModel2()
-        self.assertNotEqual(base_model2, None)
+    def test_models_save(self):
+        """
+        Test for encrypted_field models now saving data.
 
-        base_model3 = MyModel3()
-        self.assertNotEqual(base_model3, None)
+        :return:  nothing as is a test case.
 
-        base_model4 = MyModel4()
-        self.assertNotEqual(base_model4, None)
+        """
+        # One transaction for the whole matrix: a single BEGIN/COMMIT and
+        # one fsync instead of one per save().
+        with transaction.atomic(using='default'):
+            for model_cls, attr, algorithm in CASES:
+                with self.subTest(model=model_cls.__name__):
+                    settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = algorithm
+                    # One INSERT per model through bulk_create, one SELECT
+                    # back through in_bulk, instead of save()/get() pairs.
+                    group = model_cls.objects.bulk_create(
+                        [model_cls(**{attr: SECRET})]
+                    )
+                    test_instances = model_cls.objects.in_bulk(
+                        [base_model.pk for base_model in group]
+                    )
+                    for base_model in group:
+                        self.assertGreater(base_model.pk, 0)
+                        self.assertEqual(
+                            SECRET,
+                            getattr(test_instances[base_model.pk], attr)
+                        )
+
+    def test_encrypt_many(self):
+        """
+        Test the batch encryption entry point for every algorithm, both
+        the AEAD-backed fast path (ChaCha20 Poly1305, AES GCM) and the
+        per-value fallback the other algorithms take.
 
-        base_model5 = MyModel5()
-        self.assertNotEqual(base_model5, None)
+        :return:  nothing as is a test case.
 
-        base_model6 = MyModel6()
-        self.assertNotEqual(base_model6, None)
+        """
+        for model_cls, attr, algorithm in CASES:
+            with self.subTest(model=model_cls.__name__):
+                settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = algorithm
+                field = model_cls._meta.get_field(attr)
+                messages = ['%s [%d]' % (SECRET, index) for index in range(5)]
+                encrypted = field.encrypt_many(messages)
+                self.assertEqual(len(messages), len(encrypted))
+                for message, encrypted_data in zip(messages, encrypted):
+                    self.assertNotEqual(message, encrypted_data)
+                    self.assertEqual(
+                        message,
+                        field.decrypt(encrypted_data=encrypted_data)
+                    )
+
+    def test_bulk_nonce(self):
+        """
+        Test deterministic nonces (bulk_nonce=True) for the two AEAD
+        algorithms that support them: the batch must round-trip and no
+        nonce may repeat within it.
 
-        base_model7 = MyModel7()
-        self.assertNotEqual(base_model7, None)
+        :return:  nothing as is a test case.
 
-        base_model8 = MyModel8()
-        self.assertNotEqual(base_model8, None)
+        """
+        for algorithm in ('CC20P', 'AGCM'):
+            with self.subTest(algorithm=algorithm):
+                field = EncryptedField(algorithm=algorithm, bulk_nonce=True)
+                messages = ['%s [%d]' % (SECRET, index) for index in range(20)]
+                encrypted = field.encrypt_many(messages)
+                nonces = set()
+                for message, encrypted_data in zip(messages, encrypted):
+                    # Envelope layout: magic, algo id, nonce len, tag len,
+                    # then the nonce itself.
+                    blob = b64decode(encrypted_data)
+                    nonces.add(blob[4:4 + blob[2]])
+                    self.assertEqual(
+                        message,
+                        field.decrypt(encrypted_data=encrypted_data)
+                    )
+                self.assertEqual(len(messages), len(nonces))
+
+    def test_concurrent_encryption(self):
+        """
+        Test the encrypt/decrypt path under concurrent callers. The AEAD
+        backends release the GIL, so nine workers round-tripping at once
+        exercise the shared cipher pools the way a busy site would. The
+        ORM is kept out on purpose: in-memory SQLite is per-connection,
+        so threading the saves would only measure connection churn.
 
-        base_model9 = MyModel9()
-        self.assertNotEqual(base_model9, None)
+        :return:  nothing as is a test case.
 
-    def test_models_save(self):
         """
-        Test for encrypted_field models now saving data.
+        field = MyModel._meta.get_field('seed')
 
-        :return:  nothing as is a test case.
+        def round_trip(index):
+            message = '%s [%d]' % (SECRET, index)
+            encrypted_data = field.encrypt(message)
+            return message, field.decrypt(encrypted_data=encrypted_data)
+
+        with ThreadPoolExecutor(max_workers=9) as executor:
+            for message, decrypted in executor.map(round_trip, range(27)):
+                self.assertEqual(message, decrypted)
 
+    def test_bytearray_key(self):
         """
-        secret_message = 'A very critical secret.'
+        Test a bytearray key end to end: validate_key accepts it, and the
+        cached decrypt path has to normalize it before hashing.
+
+        :return:  nothing as is a test case.
 
+        """
         settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'CC20P'
+        settings.DJANGO_ENCRYPTED_FIELD_KEY = bytearray(
+            b'12345678901234567890123456789012'
+        )
         base_model = MyModel()
-        base_model.seed = secret_message
+        base_model.seed = SECRET
         base_model.save()
-        self.assertGreater(base_model.id, 0)
-        test_base_instance = MyModel.objects.get(id=base_model.id)
-        self.assertEqual(secret_message, test_base_instance.seed)
+        test_instance = MyModel.objects.get(pk=base_model.pk)
+        self.assertEqual(SECRET, test_instance.seed)
 
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'CC20P'
-        base_model2 = MyModel2()
-        base_model2.seed_hidden = secret_message
-        base_model2.save()
-        self.assertGreater(base_model2.id, 0)
-        test_base_instance2 = MyModel2.objects.get(id=base_model2.id)
-        self.assertEqual(secret_message, test_base_instance2.seed_hidden)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'CC20'
-        base_model3 = MyModel3()
-        base_model3.seed = secret_message
-        base_model3.save()
-        self.assertGreater(base_model3.id, 0)
-        test_base_instance3 = MyModel3.objects.get(id=base_model3.id)
-        self.assertEqual(secret_message, test_base_instance3.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'SS20'
-        base_model4 = MyModel4()
-        base_model4.seed = secret_message
-        base_model4.save()
-        self.assertGreater(base_model4.id, 0)
-        test_base_instance4 = MyModel4.objects.get(id=base_model4.id)
-        self.assertEqual(secret_message, test_base_instance4.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'AGCM'
-        base_model5 = MyModel5()
-        base_model5.seed = secret_message
-        base_model5.save()
-        self.assertGreater(base_model5.id, 0)
-        test_base_instance5 = MyModel5.objects.get(id=base_model5.id)
-        self.assertEqual(secret_message, test_base_instance5.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'ASIV'
-        base_model6 = MyModel6()
-        base_model6.seed = secret_message
-        base_model6.save()
-        self.assertGreater(base_model6.id, 0)
-        test_base_instance6 = MyModel6.objects.get(id=base_model6.id)
-        self.assertEqual(secret_message, test_base_instance6.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'AEAX'
-        base_model7 = MyModel7()
-        base_model7.seed = secret_message
-        base_model7.save()
-        self.assertGreater(base_model7.id, 0)
-        test_base_instance7 = MyModel7.objects.get(id=base_model7.id)
-        self.assertEqual(secret_message, test_base_instance7.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'ACCM'
-        base_model8 = MyModel8()
-        base_model8.seed = secret_message
-        base_model8.save()
-        self.assertGreater(base_model8.id, 0)
-        test_base_instance8 = MyModel8.objects.get(id=base_model8.id)
-        self.assertEqual(secret_message, test_base_instance8.seed)
-
-        settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'AOCB'
-        base_model9 = MyModel9()
-        base_model9.seed = secret_message
-        base_model9.save()
-        self.assertGreater(base_model9.id, 0)
-        test_base_instance9 = MyModel9.objects.get(id=base_model9.id)
-        self.assertEqual(secret_message, test_base_instance9.seed)
+        # Restore KEY to avoid conflicts with other tests.
+        settings.DJANGO_ENCRYPTED_FIELD_KEY = b'12345678901234567890123456789012'
 
     def test_invalid_parameters(self):
         """
@@ -171,13 +225,11 @@ class AllTests(unittest.TestCase):
         :return:  nothing as is a test case.
 
         """
-        secret_message = 'A very critical secret.'
-
         settings.DJANGO_ENCRYPTED_FIELD_ALGORITHM = 'CC20P'
         # Bytes ok, wrong len 11 (must be 32)
         settings.DJANGO_ENCRYPTED_FIELD_KEY = b'12345678901'
         base_model = MyModel()
-        base_model.seed = secret_message
+        base_model.seed = SECRET
         with self.assertRaises(InvalidKeyLengthException) as context:
             base_model.save()
         self.assertTrue('key must be 32 bytes/256 bit long' in str(context.exception))
@@ -185,7 +237,7 @@ class AllTests(unittest.TestCase):
         # Bytes wrong, len 32 OK
         settings.DJANGO_ENCRYPTED_FIELD_KEY = '12345678901234567890123456789012'
         base_model = MyModel()
-        base_model.seed = secret_message
+        base_model.seed = SECRET
         with self.assertRaises(InvalidKeyLengthException) as context:
             base_model.save()
         self.assertTrue('must be BYTES' in str(context.exception))
@@ -195,13 +247,10 @@ class AllTests(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    # REMOVE database test files.
-    try:
-        os.remove("db.tests.sqlite")
-    except:
-        pass
-
-    call_command('makemigrations', interactive=False)
-    call_command('migrate', interactive=False)
+    setup_test_environment()
+
+    # The checked-in migrations are authoritative: no need to rescan and
+    # rehash every model on each run just to find nothing to do.
+    call_command('migrate', interactive=False, verbosity=0)
 
     unittest.main()
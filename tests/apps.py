@@ -0,0 +1,30 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+def tune_sqlite(sender, connection, **kwargs):
+    """
+    Apply the throwaway-database PRAGMAs on every new SQLite connection.
+
+    The sqlite 'init_command' database OPTION would do the same, but it
+    only exists from Django 5.1 on and the package still supports 4.x.
+
+    :param sender: the backend class emitting the signal.
+    :param connection: the freshly created connection.
+    :return: nothing.
+    """
+    if connection.vendor != 'sqlite':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA synchronous=OFF')
+        cursor.execute('PRAGMA journal_mode=MEMORY')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-64000')
+
+
+class TestsConfig(AppConfig):
+    name = 'tests'
+
+    def ready(self):
+        connection_created.connect(tune_sqlite)
@@ -13,6 +13,10 @@ from encrypted_field.fields import (
 
 class Migration(migrations.Migration):
 
+    # Run all nine CREATE TABLEs under one journaled transaction instead
+    # of syncing between statements.
+    atomic = True
+
     initial = True
 
     dependencies = [
@@ -5,6 +5,8 @@ from django.db import migrations, models
 
 class Migration(migrations.Migration):
 
+    atomic = True
+
     dependencies = [
         ('tests', '0001_initial'),
     ]
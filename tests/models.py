@@ -11,37 +11,25 @@ from encrypted_field.fields import (
 )
 
 
-class MyModel(models.Model):
-    seed = EncryptedField()
-
-
-class MyModel2(models.Model):
-    seed_hidden = EncryptedField(hide_algorithm=True)
-
-
-class MyModel3(models.Model):
-    seed = EncryptedField(header=b'Custom header', algorithm=ALGORITHM_CHACHA20)
-
-
-class MyModel4(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_SALSA20)
-
-
-class MyModel5(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_AES_GCM)
-
-
-class MyModel6(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_AES_SIV)
-
-
-class MyModel7(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_AES_EAX)
-
-
-class MyModel8(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_AES_CCM)
-
-
-class MyModel9(models.Model):
-    seed = EncryptedField(algorithm=ALGORITHM_AES_OCB)
+# The nine models only differ in the field keyword arguments, so build
+# them in one loop instead of nine class statements. The class names must
+# stay exactly as before: the checked-in migrations reference them.
+_SPECS = [
+    ('MyModel', {'seed': EncryptedField()}),
+    ('MyModel2', {'seed_hidden': EncryptedField(hide_algorithm=True)}),
+    ('MyModel3', {'seed': EncryptedField(header=b'Custom header',
+                                         algorithm=ALGORITHM_CHACHA20)}),
+    ('MyModel4', {'seed': EncryptedField(algorithm=ALGORITHM_SALSA20)}),
+    ('MyModel5', {'seed': EncryptedField(algorithm=ALGORITHM_AES_GCM)}),
+    ('MyModel6', {'seed': EncryptedField(algorithm=ALGORITHM_AES_SIV)}),
+    ('MyModel7', {'seed': EncryptedField(algorithm=ALGORITHM_AES_EAX)}),
+    ('MyModel8', {'seed': EncryptedField(algorithm=ALGORITHM_AES_CCM)}),
+    ('MyModel9', {'seed': EncryptedField(algorithm=ALGORITHM_AES_OCB)}),
+]
+
+for _name, _fields in _SPECS:
+    globals()[_name] = type(
+        _name,
+        (models.Model,),
+        {**_fields, '__module__': __name__}
+    )
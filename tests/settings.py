@@ -7,9 +7,13 @@ INSTALLED_APPS = [
     'tests'
 ]
 
+# The test database is ephemeral: keep it fully in memory and drop every
+# durability guarantee, so save() measures the crypto cost and not fsyncs.
+# The PRAGMAs live in tests.apps.tune_sqlite (connection_created signal),
+# which works on every supported Django version.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': 'db.tests.sqlite',
+        'NAME': ':memory:',
     }
 }